@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Final
 
 from probe import aniso_options
@@ -387,6 +388,7 @@ def find_option_sources() -> tuple:
         for entry in _tab_option_sources(tab_name, data))
 
 
+@lru_cache(maxsize=None)
 def find_profile_fields() -> tuple:
     return tuple(
         (widget_key, get_setting_section(tab_name, setting_key), config_key)
@@ -395,6 +397,18 @@ def find_profile_fields() -> tuple:
         for widget_key, config_key in find_setting_fields(tab_name, setting_key))
 
 
+@lru_cache(maxsize=None)
+def find_profile_widget_keys() -> tuple:
+    return tuple(widget_key for widget_key, _, _ in find_profile_fields())
+
+
+@lru_cache(maxsize=None)
+def find_section_widget_keys() -> dict:
+    return {
+        section + "." + config_key: widget_key
+        for widget_key, section, config_key in find_profile_fields()}
+
+
 def get_option_label(option_key: str) -> str:
     return OPTIONS_DB[option_key]["label"]
 
@@ -1,7 +1,5 @@
 from typing import Final
 
-from database import DEFAULT_VALUE
-from database import find_profile_fields
 from profiles import process_profile_widgets_block_signals
 from profiles import process_profile_widgets_reset
 from profiles import process_widget_value_update
@@ -103,12 +101,6 @@ def is_valid_preset_name(preset_name: str) -> bool:
     return preset_name in PRESET_OVERRIDES
 
 
-def build_preset_values(preset_name: str) -> dict:
-    return {
-        **{widget_key: DEFAULT_VALUE for widget_key, _, _ in find_profile_fields()},
-        **PRESET_OVERRIDES.get(preset_name, {})}
-
-
 def build_preset_combo_items(combo_widget) -> None:
     combo_widget.blockSignals(True)
     combo_widget.clear()
@@ -120,12 +112,12 @@ def build_preset_combo_items(combo_widget) -> None:
     return None
 
 
-def _preset_dropped(widget_collection: dict, values: dict) -> tuple:
+def _preset_dropped(widget_collection: dict, overrides: dict) -> tuple:
     return tuple(
         widget_key
-        for widget_key, setting_value in values.items()
-        if widget_collection.get(widget_key) is not None
-        and not process_widget_value_update(widget_collection[widget_key], setting_value))
+        for widget_key, setting_value in overrides.items()
+        if (widget := widget_collection.get(widget_key)) is not None
+        and not process_widget_value_update(widget, setting_value))
 
 
 def process_preset_apply(widget_collection: dict, preset_name: str) -> tuple:
@@ -135,6 +127,6 @@ def process_preset_apply(widget_collection: dict, preset_name: str) -> tuple:
         case True:
             process_profile_widgets_block_signals(widget_collection, True)
             process_profile_widgets_reset(widget_collection)
-            dropped = _preset_dropped(widget_collection, build_preset_values(preset_name))
+            dropped = _preset_dropped(widget_collection, PRESET_OVERRIDES[preset_name])
             process_profile_widgets_block_signals(widget_collection, False)
             return dropped
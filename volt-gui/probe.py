@@ -1,5 +1,6 @@
 import os
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Final
 
@@ -26,7 +27,10 @@ LEVEL_FALLBACK: Final[float] = 14.0
 MIN_COUNT_FALLBACK: Final[float] = 2.0
 MAX_COUNT_FALLBACK: Final[float] = 0.0
 
+PROBE_CACHE: Final[dict] = {"stamp": None, "data": {}}
 
+
+@lru_cache(maxsize=None)
 def build_probe_path() -> Path:
     return Path(os.path.expanduser("~/.config/volt-gui")) / PROBE_FILE
 
@@ -39,20 +43,30 @@ def parse_probe_text(text: str) -> dict:
     return dict(_pair_of(line) for line in text.splitlines() if "=" in line)
 
 
-def call_read_probe() -> dict:
-    match build_probe_path().exists():
-        case False:
-            return {}
-        case True:
-            return parse_probe_text(build_probe_path().read_text(encoding="utf-8"))
+def call_probe_cache_stamp() -> tuple:
+    try:
+        stat_result = build_probe_path().stat()
+    except FileNotFoundError:
+        return ()
+    return (stat_result.st_mtime_ns, stat_result.st_size)
 
 
-def call_probe_stamp() -> float:
-    match build_probe_path().exists():
-        case False:
-            return 0.0
+def call_parse_probe() -> dict:
+    try:
+        return parse_probe_text(build_probe_path().read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+
+
+def call_read_probe() -> dict:
+    stamp = call_probe_cache_stamp()
+    match stamp == PROBE_CACHE["stamp"]:
         case True:
-            return build_probe_path().stat().st_mtime
+            return PROBE_CACHE["data"]
+        case False:
+            PROBE_CACHE["data"] = call_parse_probe()
+            PROBE_CACHE["stamp"] = stamp
+            return PROBE_CACHE["data"]
 
 
 def probe_text(data: dict, key: str) -> str:
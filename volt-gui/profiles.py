@@ -1,6 +1,7 @@
 import os
 
-from functools import reduce
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import Final
 from typing import Optional
@@ -9,13 +10,17 @@ from database import DEFAULT_PROFILE
 from database import DEFAULT_VALUE
 from database import find_option_sources
 from database import find_profile_fields
+from database import find_profile_widget_keys
+from database import find_section_widget_keys
 
 SECTION_ORDER: Final[tuple] = ("gpu", "display", "textures", "rendering", "framerate")
 OPTIONS_FILE: Final[str] = "options.toml"
 PROFILE_SUFFIX: Final[str] = ".toml"
 PAIR_SEP: Final[str] = " = "
+TEMP_SUFFIX: Final[str] = ".tmp"
 
 
+@lru_cache(maxsize=None)
 def build_config_dir() -> Path:
     return Path(os.path.expanduser("~/.config/volt-gui"))
 
@@ -24,6 +29,7 @@ def build_profile_path(profile_name: str) -> Path:
     return build_config_dir() / (profile_name + PROFILE_SUFFIX)
 
 
+@lru_cache(maxsize=None)
 def build_options_path() -> Path:
     return build_config_dir() / OPTIONS_FILE
 
@@ -69,6 +75,11 @@ def serialize_profile(values: dict) -> str:
         for line in _section_lines(section, _pairs_for_section(values, section)))
 
 
+def _split_pair(line: str) -> tuple:
+    key, _, value = line.partition("=")
+    return (key.strip(), value.strip().strip('"'))
+
+
 def _classify_line(line: str) -> tuple:
     match (line.startswith("["), PAIR_SEP.strip() in line, line.startswith("#"), line):
         case (_, _, True, _) | (_, _, _, ""):
@@ -76,31 +87,29 @@ def _classify_line(line: str) -> tuple:
         case (True, _, _, _):
             return ("section", line.strip("[]").strip())
         case (False, True, _, _):
-            return ("pair", line.split("=", 1)[0].strip(), line.split("=", 1)[1].strip().strip('"'))
+            return ("pair",) + _split_pair(line)
         case _:
             return ("skip",)
 
 
-def _fold_line(state: tuple, line: str) -> tuple:
-    match _classify_line(line.strip()):
-        case ("section", name):
-            return (name, state[1])
-        case ("pair", key, value):
-            return (state[0], state[1] + ((state[0] + "." + key, value),))
-        case _:
-            return state
+def _iter_section_pairs(lines: list[str]) -> Iterator[tuple[str, str]]:
+    section = ""
+    for line in lines:
+        match _classify_line(line.strip()):
+            case ("section", name):
+                section = name
+            case ("pair", key, value):
+                yield (section + "." + key, value)
+            case _:
+                continue
 
 
 def parse_profile_text(text: str) -> dict:
-    return dict(reduce(_fold_line, text.splitlines(), ("", ()))[1])
+    return dict(_iter_section_pairs(text.splitlines()))
 
 
 def _widget_key_for(section_key: str) -> Optional[str]:
-    return next(
-        (widget_key
-         for widget_key, section, config_key in find_profile_fields()
-         if section + "." + config_key == section_key),
-        None)
+    return find_section_widget_keys().get(section_key)
 
 
 def widget_value(widget) -> str:
@@ -131,7 +140,7 @@ def process_widget_options_rebuild(widget, options: tuple) -> None:
 
 
 def process_profile_widgets_block_signals(widget_collection: dict, should_block: bool) -> None:
-    for widget_key, _, _ in find_profile_fields():
+    for widget_key in find_profile_widget_keys():
         match widget_collection.get(widget_key):
             case None:
                 continue
@@ -141,7 +150,7 @@ def process_profile_widgets_block_signals(widget_collection: dict, should_block:
 
 
 def process_profile_widgets_reset(widget_collection: dict) -> None:
-    for widget_key, _, _ in find_profile_fields():
+    for widget_key in find_profile_widget_keys():
         match widget_collection.get(widget_key):
             case None:
                 continue
@@ -162,17 +171,20 @@ def process_profile_options_rebuild(widget_collection: dict) -> None:
 
 def collect_widget_values(widget_collection: dict) -> dict:
     return {
-        widget_key: widget_value(widget_collection[widget_key])
-        for widget_key, _, _ in find_profile_fields()
-        if widget_collection.get(widget_key) is not None}
+        widget_key: widget_value(widget)
+        for widget_key in find_profile_widget_keys()
+        if (widget := widget_collection.get(widget_key)) is not None}
+
+
+def call_read_text(file_path: Path) -> str:
+    try:
+        return file_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return ""
 
 
 def call_read_profile(profile_name: str) -> dict:
-    match build_profile_path(profile_name).exists():
-        case False:
-            return {}
-        case True:
-            return parse_profile_text(build_profile_path(profile_name).read_text(encoding="utf-8"))
+    return parse_profile_text(call_read_text(build_profile_path(profile_name)))
 
 
 def _apply_to_widget(widget_collection: dict, widget_key: str, value: str) -> bool:
@@ -210,12 +222,32 @@ def process_profile_widget_load(widget_collection: dict, profile_name: str) -> t
     return dropped
 
 
-def call_write_profile(values: dict, profile_name: str) -> None:
-    build_config_dir().mkdir(parents=True, exist_ok=True)
-    build_profile_path(profile_name).write_text(serialize_profile(values), encoding="utf-8")
+def call_write_text(file_path: Path, text: str) -> None:
+    try:
+        file_path.write_text(text, encoding="utf-8")
+    except FileNotFoundError:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(text, encoding="utf-8")
     return None
 
 
+def call_write_atomic(file_path: Path, text: str) -> None:
+    temp_path = file_path.with_name(file_path.name + TEMP_SUFFIX)
+    call_write_text(temp_path, text)
+    os.replace(temp_path, file_path)
+    return None
+
+
+def call_write_profile(values: dict, profile_name: str) -> None:
+    profile_text = serialize_profile(values)
+    match call_read_text(build_profile_path(profile_name)) == profile_text:
+        case True:
+            return None
+        case False:
+            call_write_atomic(build_profile_path(profile_name), profile_text)
+            return None
+
+
 def process_profile_save(widget_collection: dict, profile_name: str) -> None:
     call_write_profile(collect_widget_values(widget_collection), profile_name)
     return None
@@ -1,8 +1,13 @@
+from functools import lru_cache
+from typing import Final
+
 from PySide6.QtGui import QColor
 from PySide6.QtGui import QPalette
 
 from database import get_accent_colors
 
+ACCENT_KEYS: Final[tuple] = ("accent", "accent_hover", "accent_pressed")
+
 
 def get_style_palette_roles() -> tuple:
     return (
@@ -102,12 +107,15 @@ def build_theme_colors(theme_name: str) -> dict:
         "text_secondary": "#9A9A9A",
         "text_disabled": "#444444",
         "card_background": "#1a1a1a",
-        "accent": get_accent_colors(theme_name)[0],
-        "accent_hover": get_accent_colors(theme_name)[1],
-        "accent_pressed": get_accent_colors(theme_name)[2],
+        **dict(zip(ACCENT_KEYS, get_accent_colors(theme_name))),
     }
 
 
+@lru_cache(maxsize=None)
+def build_theme_stylesheet(theme_name: str) -> str:
+    return get_style_stylesheet_template().format(**build_theme_colors(theme_name))
+
+
 def build_palette(color_map: dict) -> QPalette:
     palette_instance = QPalette()
     for palette_role, color_key in get_style_palette_roles():
@@ -125,8 +133,11 @@ def process_theme_application(application_instance, theme_name: str) -> None:
     match application_instance:
         case None:
             return None
+        case app if app.property("themeName") == theme_name:
+            return None
         case app:
             color_map = build_theme_colors(theme_name)
-            app.setStyleSheet(get_style_stylesheet_template().format(**color_map))
+            app.setStyleSheet(build_theme_stylesheet(theme_name))
             app.setPalette(apply_disabled_roles(build_palette(color_map), color_map))
+            app.setProperty("themeName", theme_name)
             return None
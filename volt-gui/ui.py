@@ -138,18 +138,34 @@ def build_monospace_font() -> QFont:
     return monospace_font
 
 
-def process_copy_button_action(copy_button, clipboard_text: str) -> None:
-    QApplication.clipboard().setText(clipboard_text)
-    copy_button.setText("Copied!")
+def create_copy_animation(copy_button) -> QPropertyAnimation:
     effect = QGraphicsOpacityEffect(copy_button)
+    effect.setEnabled(False)
     copy_button.setGraphicsEffect(effect)
-    animation = QPropertyAnimation(effect, b"opacity")
+    animation = QPropertyAnimation(effect, b"opacity", copy_button)
     animation.setDuration(200)
     animation.setStartValue(0.7)
     animation.setEndValue(1.0)
     animation.setEasingCurve(QEasingCurve.OutCubic)
-    animation.start()
-    QTimer.singleShot(1000, lambda: copy_button.setText("Copy"))
+    animation.finished.connect(lambda: effect.setEnabled(False))
+    return animation
+
+
+def create_copy_reset_timer(copy_button) -> QTimer:
+    timer = QTimer(copy_button)
+    timer.setSingleShot(True)
+    timer.setInterval(1000)
+    timer.timeout.connect(lambda: copy_button.setText("Copy"))
+    return timer
+
+
+def process_copy_button_action(copy_button, clipboard_text: str) -> None:
+    QApplication.clipboard().setText(clipboard_text)
+    copy_button.setText("Copied!")
+    copy_button.copy_animation.stop()
+    copy_button.copy_animation.targetObject().setEnabled(True)
+    copy_button.copy_animation.start()
+    copy_button.copy_reset_timer.start()
     return None
 
 
@@ -180,6 +196,8 @@ def create_code_block_widget(code_text: str) -> QFrame:
     copy_button.setCursor(QCursor(Qt.PointingHandCursor))
     copy_button.setFixedSize(get_copy_button_width(), get_standard_button_height())
     copy_button.setStyleSheet(build_copy_button_stylesheet(get_copy_button_width(), get_standard_button_height()))
+    copy_button.copy_animation = create_copy_animation(copy_button)
+    copy_button.copy_reset_timer = create_copy_reset_timer(copy_button)
     copy_button.clicked.connect(lambda: process_copy_button_action(copy_button, text_edit.toPlainText()))
     layout.addWidget(text_edit, 1)
     layout.addWidget(copy_button, 0)
@@ -1,19 +1,21 @@
-import configparser
-import json
 import os
 import signal
-import socket
 import sys
-import urllib.request
+import time
 
+from functools import lru_cache
+from functools import partial
 from typing import Final
 
+from PySide6.QtCore import QFileSystemWatcher
 from PySide6.QtCore import QProcess
 from PySide6.QtCore import Qt
 from PySide6.QtCore import QThread
 from PySide6.QtCore import QTimer
 from PySide6.QtGui import QAction
 from PySide6.QtGui import QIcon
+from PySide6.QtNetwork import QLocalServer
+from PySide6.QtNetwork import QLocalSocket
 from PySide6.QtWidgets import QApplication
 from PySide6.QtWidgets import QComboBox
 from PySide6.QtWidgets import QDialogButtonBox
@@ -45,9 +47,11 @@ from presets import build_preset_combo_items
 from presets import get_preset_placeholder_label
 from presets import is_valid_preset_name
 from presets import process_preset_apply
-from probe import call_probe_stamp
+from probe import build_probe_path
+from probe import call_probe_cache_stamp
 from profiles import build_config_dir
 from profiles import build_options_path
+from profiles import call_write_atomic
 from profiles import find_all_profiles
 from profiles import process_profile_delete
 from profiles import process_profile_options_rebuild
@@ -61,12 +65,14 @@ from ui import create_scrollable_content_area
 from ui import create_tab_content_widget
 from ui import build_sidebar_container_widget
 from ui import get_header_vertical_margin
-from welcome import create_welcome_window_widget
 
 UPDATE_URL: Final[str] = "https://api.github.com/repos/pythonlover02/volt-gui/releases/latest"
 UPDATE_TIMEOUT_S: Final[int] = 5
-SINGLETON_PORT: Final[int] = 47832
+SINGLETON_NAME: Final[str] = "volt-gui-singleton"
+SINGLETON_CONNECT_MS: Final[int] = 200
 OPTIONS_SAVE_DEBOUNCE_MS: Final[int] = 500
+NOTIFY_TIMEOUT_MS: Final[int] = 2000
+NOTIFY_REPEAT_S: Final[float] = 1.0
 NEW_PROFILE_LABEL: Final[str] = "New Profile..."
 DELETE_PROFILE_LABEL: Final[str] = "Delete Current"
 SCALE_MIN: Final[float] = 0.5
@@ -74,9 +80,17 @@ SCALE_MAX: Final[float] = 3.0
 DEFAULT_SCALE: Final[str] = "1.0"
 PREVIEW_BIN: Final[str] = "volt"
 PREVIEW_TARGET: Final[str] = "vkgears"
-PREVIEW_POLL_MS: Final[int] = 750
 PREVIEW_START_MS: Final[int] = 300
 PREVIEW_STOP_MS: Final[int] = 1500
+PROBE_SETTLE_MS: Final[int] = 150
+APP_ICON_NAME: Final[str] = "preferences-system"
+
+OPTIONS_CACHE: Final[dict] = {"stamp": None, "data": {}}
+
+
+@lru_cache(maxsize=None)
+def build_app_icon() -> QIcon:
+    return QIcon.fromTheme(APP_ICON_NAME)
 
 
 def build_preview_args(profile_name: str) -> list:
@@ -91,19 +105,72 @@ def build_launch_command(profile_name: str) -> str:
             return "volt " + profile_name + " -- %command%"
 
 
-def get_persisted_option_value(option_key: str) -> str:
-    match build_options_path().exists():
+def call_options_stamp() -> tuple:
+    try:
+        stat_result = build_options_path().stat()
+    except FileNotFoundError:
+        return ()
+    return (stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def process_options_cache_store(options_data: dict) -> None:
+    OPTIONS_CACHE["stamp"] = call_options_stamp()
+    OPTIONS_CACHE["data"] = options_data
+    return None
+
+
+def parse_options_text(text: str) -> dict:
+    options_data = {}
+    section_name = ""
+    for line in text.splitlines():
+        line = line.strip()
+        match (line.startswith("["), "=" in line):
+            case (True, _):
+                section_name = line.strip("[]").strip()
+            case (False, True):
+                option_key, _, value = line.partition("=")
+                options_data.setdefault(section_name, {})[option_key.strip()] = value.strip()
+            case _:
+                continue
+    return options_data
+
+
+def serialize_options(snapshot: dict) -> str:
+    return "".join(
+        "[" + section_name + "]\n"
+        + "".join(option_key + " = " + value + "\n" for option_key, value in section.items())
+        + "\n"
+        for section_name, section in snapshot.items())
+
+
+def call_parse_options() -> dict:
+    try:
+        return parse_options_text(build_options_path().read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+
+
+def call_read_options() -> dict:
+    match call_options_stamp() == OPTIONS_CACHE["stamp"]:
+        case True:
+            return OPTIONS_CACHE["data"]
         case False:
-            return get_option_default_value(option_key)
+            options_data = call_parse_options()
+            process_options_cache_store(options_data)
+            return options_data
+
+
+def find_options_section(section_name: str) -> dict:
+    return call_read_options().get(section_name, {})
+
+
+def get_persisted_option_value(option_key: str) -> str:
+    saved = find_options_section("Options").get(option_key, "").strip()
+    match saved == "":
         case True:
-            parser_instance = configparser.ConfigParser(interpolation=None)
-            parser_instance.read(build_options_path())
-            saved = parser_instance.get("Options", option_key, fallback="").strip()
-            match saved == "":
-                case True:
-                    return get_option_default_value(option_key)
-                case False:
-                    return saved
+            return get_option_default_value(option_key)
+        case False:
+            return saved
 
 
 def is_scale_text(raw: str) -> bool:
@@ -183,14 +250,14 @@ def create_options_tab_widget() -> dict:
 
 
 def process_profile_list_update(main_window) -> None:
-    main_window.profile_selector.blockSignals(True)
-    main_window.profile_selector.clear()
-    for profile_name in find_all_profiles():
-        main_window.profile_selector.addItem(profile_name)
-    main_window.profile_selector.insertSeparator(main_window.profile_selector.count())
-    main_window.profile_selector.addItem(NEW_PROFILE_LABEL)
-    main_window.profile_selector.addItem(DELETE_PROFILE_LABEL)
-    main_window.profile_selector.blockSignals(False)
+    selector = main_window.profile_selector
+    main_window.profile_names = find_all_profiles()
+    selector.blockSignals(True)
+    selector.clear()
+    selector.addItems(main_window.profile_names)
+    selector.insertSeparator(selector.count())
+    selector.addItems((NEW_PROFILE_LABEL, DELETE_PROFILE_LABEL))
+    selector.blockSignals(False)
     return None
 
 
@@ -207,7 +274,7 @@ def process_launch_line_update(main_window) -> None:
 
 
 def process_profile_change(main_window, profile_name: str) -> None:
-    match getattr(main_window, "initial_setup_complete", False):
+    match main_window.initial_setup_complete:
         case False:
             return None
         case True:
@@ -217,7 +284,6 @@ def process_profile_change(main_window, profile_name: str) -> None:
                 main_window,
                 process_profile_widget_load(main_window.all_widgets, profile_name))
             process_launch_line_update(main_window)
-            process_tray_menu_update(main_window)
             process_preview_start(main_window)
             return None
 
@@ -254,7 +320,6 @@ def process_new_profile_save(main_window) -> None:
             process_profile_list_update(main_window)
             process_profile_selector_restore(main_window)
             process_launch_line_update(main_window)
-            process_tray_menu_update(main_window)
             process_notification_display(main_window, "Profile '" + profile_name.strip() + "' created.", False)
             return None
         case (True, False):
@@ -280,7 +345,6 @@ def process_current_profile_delete(main_window) -> None:
                     process_profile_selector_restore(main_window)
                     process_profile_widget_load(main_window.all_widgets, DEFAULT_PROFILE)
                     process_launch_line_update(main_window)
-                    process_tray_menu_update(main_window)
                     process_notification_display(main_window, "Profile deleted.", False)
                     return None
 
@@ -318,36 +382,48 @@ def process_preset_combo_change(main_window, selected_text: str) -> None:
             return None
 
 
+def create_tray_actions(main_window) -> dict:
+    show_action = QAction("Show", main_window)
+    show_action.triggered.connect(lambda: process_window_show(main_window))
+    quit_action = QAction("Quit", main_window)
+    quit_action.triggered.connect(lambda: process_application_quit(main_window))
+    return {"show": show_action, "quit": quit_action}
+
+
 def create_system_tray_widget(main_window) -> None:
     match QSystemTrayIcon.isSystemTrayAvailable():
         case False:
             return None
         case True:
             main_window.tray_icon = QSystemTrayIcon(main_window)
-            main_window.tray_icon.setIcon(QIcon.fromTheme("preferences-system"))
-            menu = QMenu()
-            menu.addAction(QAction("Show", main_window, triggered=lambda: process_window_show(main_window)))
+            main_window.tray_icon.setIcon(build_app_icon())
+            menu = QMenu(main_window)
+            menu.addAction(main_window.tray_actions["show"])
             main_window.profile_submenu = QMenu("Apply Profile", menu)
-            process_tray_menu_update(main_window)
+            main_window.tray_profiles = ()
+            menu.aboutToShow.connect(lambda: process_tray_menu_update(main_window))
             menu.addMenu(main_window.profile_submenu)
             menu.addSeparator()
-            menu.addAction(QAction("Quit", main_window, triggered=lambda: process_application_quit(main_window)))
+            menu.addAction(main_window.tray_actions["quit"])
             main_window.tray_icon.setContextMenu(menu)
+            main_window.tray_menu = menu
             main_window.tray_icon.show()
             main_window.tray_icon.activated.connect(lambda activation_reason: process_tray_activation(main_window, activation_reason))
             return None
 
 
 def process_tray_menu_update(main_window) -> None:
-    match hasattr(main_window, "profile_submenu"):
-        case False:
+    profile_names = main_window.profile_names
+    match (main_window.profile_submenu is None, profile_names == main_window.tray_profiles):
+        case (True, _) | (False, True):
             return None
-        case True:
+        case (False, False):
             main_window.profile_submenu.clear()
-            for profile_name in find_all_profiles():
-                action = QAction("Apply " + profile_name, main_window)
-                action.triggered.connect(lambda checked, bound_profile_name=profile_name: process_profile_apply_from_tray(main_window, bound_profile_name))
+            for profile_name in profile_names:
+                action = QAction("Apply " + profile_name, main_window.profile_submenu)
+                action.triggered.connect(partial(process_tray_profile_trigger, main_window, profile_name))
                 main_window.profile_submenu.addAction(action)
+            main_window.tray_profiles = profile_names
             return None
 
 
@@ -358,7 +434,7 @@ def process_tray_activation(main_window, activation_reason) -> None:
         case True:
             match main_window.isVisible():
                 case True:
-                    main_window.hide()
+                    process_window_hide(main_window)
                 case False:
                     process_window_show(main_window)
             return None
@@ -372,10 +448,24 @@ def process_window_show(main_window) -> None:
             main_window.show()
     main_window.activateWindow()
     main_window.raise_()
+    process_probe_stale_flush(main_window)
+    QTimer.singleShot(PREVIEW_START_MS, main_window, lambda: process_preview_resume(main_window))
+    return None
+
+
+def process_window_hide(main_window) -> None:
+    main_window.hide()
+    process_preview_stop(main_window)
+    return None
+
+
+def process_tray_profile_trigger(main_window, profile_name: str, checked: bool = False) -> None:
+    process_profile_apply_from_tray(main_window, profile_name)
     return None
 
 
 def process_profile_apply_from_tray(main_window, profile_name: str) -> None:
+    process_probe_stale_flush(main_window)
     match profile_name != main_window.current_profile:
         case True:
             process_profile_save(main_window.all_widgets, main_window.current_profile)
@@ -389,12 +479,34 @@ def process_profile_apply_from_tray(main_window, profile_name: str) -> None:
     return None
 
 
+def is_tray_usable(main_window) -> bool:
+    return main_window.tray_icon is not None and main_window.tray_icon.isVisible()
+
+
+def is_notification_repeat(main_window, notification_message: str) -> bool:
+    match main_window.last_notification:
+        case (last_message, last_time):
+            return last_message == notification_message and time.monotonic() - last_time < NOTIFY_REPEAT_S
+        case _:
+            return False
+
+
+def process_tray_message(main_window, notification_message: str, message_icon) -> None:
+    match is_notification_repeat(main_window, notification_message):
+        case True:
+            return None
+        case False:
+            main_window.last_notification = (notification_message, time.monotonic())
+            main_window.tray_icon.showMessage("volt-gui", notification_message, message_icon, NOTIFY_TIMEOUT_MS)
+            return None
+
+
 def process_notification_display(main_window, notification_message: str, is_error: bool) -> None:
-    match (hasattr(main_window, "tray_icon"), is_error):
+    match (is_tray_usable(main_window), is_error):
         case (True, True):
-            main_window.tray_icon.showMessage("volt-gui", notification_message, QSystemTrayIcon.MessageIcon.Critical, 2000)
+            process_tray_message(main_window, notification_message, QSystemTrayIcon.MessageIcon.Critical)
         case (True, False):
-            main_window.tray_icon.showMessage("volt-gui", notification_message, QSystemTrayIcon.MessageIcon.Information, 2000)
+            process_tray_message(main_window, notification_message, QSystemTrayIcon.MessageIcon.Information)
         case (False, True):
             QMessageBox.warning(main_window, "volt-gui", notification_message)
         case (False, False):
@@ -402,18 +514,30 @@ def process_notification_display(main_window, notification_message: str, is_erro
     return None
 
 
+def process_deferred_tray_create(main_window) -> None:
+    match (main_window.use_system_tray, main_window.tray_icon is None):
+        case (True, True):
+            create_system_tray_widget(main_window)
+        case _:
+            pass
+    return None
+
+
 def process_tray_option_update(main_window, tray_enabled: bool) -> None:
-    match (main_window.use_system_tray == tray_enabled, tray_enabled, hasattr(main_window, "tray_icon")):
+    match (main_window.use_system_tray == tray_enabled, tray_enabled, main_window.tray_icon is not None):
         case (True, _, _):
             main_window.use_system_tray = tray_enabled
         case (False, True, False):
             main_window.use_system_tray = tray_enabled
-            create_system_tray_widget(main_window)
+            QTimer.singleShot(0, lambda: process_deferred_tray_create(main_window))
         case (False, False, True):
             main_window.use_system_tray = tray_enabled
             main_window.tray_icon.hide()
             main_window.tray_icon.deleteLater()
-            delattr(main_window, "tray_icon")
+            main_window.tray_icon = None
+            main_window.tray_menu.deleteLater()
+            main_window.tray_menu = None
+            main_window.profile_submenu = None
             match main_window.isVisible():
                 case False:
                     process_window_show(main_window)
@@ -421,16 +545,12 @@ def process_tray_option_update(main_window, tray_enabled: bool) -> None:
                     pass
         case _:
             main_window.use_system_tray = tray_enabled
-    match QApplication.instance() is None:
-        case False:
-            QApplication.instance().setQuitOnLastWindowClosed(not main_window.use_system_tray)
-        case True:
-            pass
+    main_window.application.setQuitOnLastWindowClosed(not main_window.use_system_tray)
     return None
 
 
 def process_options_application(main_window) -> None:
-    process_theme_application(QApplication.instance(), get_resolved_option_value(main_window, "application_theme"))
+    process_theme_application(main_window.application, get_resolved_option_value(main_window, "application_theme"))
     match is_option_enabled(main_window, "window_transparency"):
         case True:
             main_window.setWindowOpacity(0.95)
@@ -445,7 +565,7 @@ def process_options_application(main_window) -> None:
 
 
 def process_options_save_timer_trigger(main_window) -> None:
-    match getattr(main_window, "options_save_timer", None):
+    match main_window.options_save_timer:
         case None:
             main_window.options_save_timer = QTimer(main_window)
             main_window.options_save_timer.setSingleShot(True)
@@ -457,7 +577,7 @@ def process_options_save_timer_trigger(main_window) -> None:
 
 
 def process_option_change(main_window) -> None:
-    match getattr(main_window, "initial_setup_complete", False):
+    match main_window.initial_setup_complete:
         case True:
             process_options_save_timer_trigger(main_window)
         case False:
@@ -465,58 +585,82 @@ def process_option_change(main_window) -> None:
     return None
 
 
-def process_application_options_save(main_window) -> None:
-    parser_instance = configparser.ConfigParser(interpolation=None)
-    parser_instance["Options"] = {
-        option_key: main_window.options_widgets[option_key].currentText().strip()
-        for option_key in OPTIONS_DB
-        if option_key in main_window.options_widgets}
-    parser_instance["Profile"] = {"last_active_profile": main_window.current_profile}
-    os.makedirs(build_config_dir(), exist_ok=True)
-    with open(build_options_path(), "w") as file_handle:
-        parser_instance.write(file_handle)
+def process_option_text_change(main_window, option_text: str) -> None:
+    process_option_change(main_window)
+    return None
+
+
+def collect_options_snapshot(main_window) -> dict:
+    return {
+        "Options": {
+            option_key: main_window.options_widgets[option_key].currentText().strip()
+            for option_key in OPTIONS_DB
+            if option_key in main_window.options_widgets},
+        "Profile": {"last_active_profile": main_window.current_profile},
+    }
+
+
+def call_write_options(snapshot: dict) -> None:
+    call_write_atomic(build_options_path(), serialize_options(snapshot))
+    process_options_cache_store(snapshot)
     return None
 
 
+def process_application_options_save(main_window) -> None:
+    snapshot = collect_options_snapshot(main_window)
+    match snapshot == call_read_options():
+        case True:
+            return None
+        case False:
+            call_write_options(snapshot)
+            return None
+
+
 def process_application_options_load(main_window) -> None:
-    parser_instance = configparser.ConfigParser(interpolation=None)
-    parser_instance.read(build_options_path())
+    saved_options = find_options_section("Options")
     for option_key in OPTIONS_DB:
-        match option_key in main_window.options_widgets:
-            case False:
+        match main_window.options_widgets.get(option_key):
+            case None:
                 continue
-            case True:
-                saved = parser_instance.get("Options", option_key, fallback=get_option_default_value(option_key))
-                main_window.options_widgets[option_key].setCurrentText(saved)
-    last_profile = parser_instance.get("Profile", "last_active_profile", fallback=DEFAULT_PROFILE)
+            case widget:
+                widget.setCurrentText(saved_options.get(option_key, get_option_default_value(option_key)))
+    last_profile = find_options_section("Profile").get("last_active_profile", DEFAULT_PROFILE)
     match main_window.profile_selector.findText(last_profile) >= 0:
         case True:
-            main_window.profile_selector.blockSignals(True)
-            main_window.profile_selector.setCurrentText(last_profile)
-            main_window.profile_selector.blockSignals(False)
             main_window.current_profile = last_profile
+            process_profile_selector_restore(main_window)
         case False:
             pass
     process_options_application(main_window)
     return None
 
 
+def is_preview_running(main_window) -> bool:
+    return main_window.preview_process.state() != QProcess.ProcessState.NotRunning
+
+
 def process_preview_stop(main_window) -> None:
-    match getattr(main_window, "preview_process", None):
-        case None:
+    match is_preview_running(main_window):
+        case False:
             return None
-        case worker:
-            worker.kill()
-            worker.waitForFinished(PREVIEW_STOP_MS)
-            main_window.preview_process = None
+        case True:
+            main_window.preview_process.kill()
+            main_window.preview_process.waitForFinished(PREVIEW_STOP_MS)
             return None
 
 
 def process_preview_start(main_window) -> None:
     process_preview_stop(main_window)
-    worker = QProcess(main_window)
-    worker.start(PREVIEW_BIN, build_preview_args(main_window.current_profile))
-    main_window.preview_process = worker
+    main_window.preview_process.start(PREVIEW_BIN, build_preview_args(main_window.current_profile))
+    return None
+
+
+def process_preview_resume(main_window) -> None:
+    match (main_window.isVisible(), is_preview_running(main_window)):
+        case (True, False):
+            process_preview_start(main_window)
+        case _:
+            pass
     return None
 
 
@@ -542,48 +686,133 @@ def process_probe_rebuild(main_window) -> None:
     return None
 
 
-def process_probe_poll(main_window) -> None:
-    match call_probe_stamp():
-        case stamp if stamp == main_window.probe_stamp:
+def process_probe_refresh(main_window, stamp: tuple) -> None:
+    match stamp == main_window.probe_stamp:
+        case True:
             return None
-        case stamp:
+        case False:
             main_window.probe_stamp = stamp
             process_probe_rebuild(main_window)
             return None
 
 
+def find_probe_watch_dir() -> str:
+    return str(next(path for path in (build_config_dir(), *build_config_dir().parents) if path.is_dir()))
+
+
+def process_probe_dir_watch_sync(main_window) -> None:
+    watched_dirs = main_window.probe_watcher.directories()
+    match str(build_config_dir()) in watched_dirs:
+        case True:
+            return None
+        case False:
+            pass
+    watch_dir = find_probe_watch_dir()
+    match watch_dir in watched_dirs:
+        case True:
+            return None
+        case False:
+            pass
+    match watched_dirs:
+        case []:
+            pass
+        case _:
+            main_window.probe_watcher.removePaths(watched_dirs)
+    main_window.probe_watcher.addPath(watch_dir)
+    return None
+
+
+def process_probe_watch_sync(main_window, stamp: tuple) -> None:
+    probe_path = str(build_probe_path())
+    match (stamp == (), probe_path in main_window.probe_watcher.files()):
+        case (False, False):
+            main_window.probe_watcher.addPath(probe_path)
+        case _:
+            pass
+    return None
+
+
+def process_probe_stale_flush(main_window) -> None:
+    match main_window.probe_stale:
+        case True:
+            main_window.probe_stale = False
+            process_probe_refresh(main_window, call_probe_cache_stamp())
+        case False:
+            pass
+    return None
+
+
+def process_probe_change(main_window) -> None:
+    process_probe_dir_watch_sync(main_window)
+    stamp = call_probe_cache_stamp()
+    process_probe_watch_sync(main_window, stamp)
+    match main_window.isVisible():
+        case False:
+            main_window.probe_stale = True
+        case True:
+            main_window.probe_stale = False
+            process_probe_refresh(main_window, stamp)
+    return None
+
+
+def create_probe_timer(main_window) -> QTimer:
+    timer = QTimer(main_window)
+    timer.setSingleShot(True)
+    timer.setInterval(PROBE_SETTLE_MS)
+    timer.timeout.connect(lambda: process_probe_change(main_window))
+    return timer
+
+
+def create_probe_watcher(main_window) -> QFileSystemWatcher:
+    watcher = QFileSystemWatcher(main_window)
+    watcher.directoryChanged.connect(lambda changed_path: main_window.probe_timer.start())
+    watcher.fileChanged.connect(lambda changed_path: main_window.probe_timer.start())
+    return watcher
+
+
 def process_all_settings_apply(main_window) -> None:
-    process_application_options_save(main_window)
+    process_options_save_timer_trigger(main_window)
     process_profile_save(main_window.all_widgets, main_window.current_profile)
     process_notification_display(main_window, "Profile '" + main_window.current_profile + "' saved. Running games pick it up live.", False)
     return None
 
 
-def process_window_close(main_window, singleton_socket, close_event) -> None:
-    match (main_window.use_system_tray, hasattr(main_window, "tray_icon")):
+def process_window_close(main_window, singleton_server, close_event) -> None:
+    match (main_window.use_system_tray, main_window.tray_icon is not None):
         case (True, True):
-            main_window.hide()
+            process_window_hide(main_window)
             close_event.ignore()
             return None
         case _:
-            process_cleanup(main_window, singleton_socket)
+            process_cleanup(main_window, singleton_server)
             QApplication.quit()
             close_event.accept()
             return None
 
 
-def process_cleanup(main_window, singleton_socket) -> None:
-    match getattr(main_window, "options_save_timer", None):
+def process_startup_profile_load(main_window) -> None:
+    startup_dropped = process_profile_widget_load(main_window.all_widgets, main_window.current_profile)
+    main_window.initial_setup_complete = True
+    process_dropped_notice(main_window, startup_dropped)
+    return None
+
+
+def process_cleanup(main_window, singleton_server) -> None:
+    match main_window.options_save_timer:
         case None:
             pass
         case timer:
             timer.stop()
     process_preview_stop(main_window)
-    process_profile_save(main_window.all_widgets, main_window.current_profile)
+    match main_window.initial_setup_complete:
+        case True:
+            process_profile_save(main_window.all_widgets, main_window.current_profile)
+        case False:
+            pass
     process_application_options_save(main_window)
-    match singleton_socket is None:
+    match singleton_server is None:
         case False:
-            singleton_socket.close()
+            singleton_server.close()
         case True:
             pass
     match main_window.welcome_window is None:
@@ -596,12 +825,13 @@ def process_cleanup(main_window, singleton_socket) -> None:
 
 
 def process_application_quit(main_window) -> None:
-    process_cleanup(main_window, main_window.singleton_socket)
+    process_cleanup(main_window, main_window.singleton_server)
     QApplication.quit()
     return None
 
 
 def process_welcome_show(main_window) -> None:
+    from welcome import create_welcome_window_widget
     match main_window.welcome_window is None:
         case True:
             main_window.welcome_window = create_welcome_window_widget()
@@ -614,17 +844,40 @@ def process_welcome_show(main_window) -> None:
 
 
 def call_fetch_latest_tag() -> str:
+    import json
+    import urllib.error
+    import urllib.request
     try:
         with urllib.request.urlopen(UPDATE_URL, timeout=UPDATE_TIMEOUT_S) as response:
             payload = json.loads(response.read().decode())
-            return str(payload.get("tag_name", "")).lstrip("v")
     except (urllib.error.URLError, ValueError, OSError):
         return ""
+    match payload:
+        case {"tag_name": str(tag_name)}:
+            return tag_name.lstrip("v")
+        case _:
+            return ""
+
+
+def is_version_text(version_text: str) -> bool:
+    return all(part.isdigit() for part in version_text.split("."))
+
+
+def build_version_parts(version_text: str) -> tuple:
+    return tuple(int(part) for part in version_text.split("."))
+
+
+def is_newer_version(latest_tag: str, current_version: str) -> bool:
+    match (is_version_text(latest_tag), is_version_text(current_version)):
+        case (True, True):
+            return build_version_parts(latest_tag) > build_version_parts(current_version)
+        case _:
+            return latest_tag.strip() not in ("", current_version)
 
 
 def process_updates_check_worker(main_window, worker_thread) -> None:
     latest_tag = call_fetch_latest_tag()
-    match latest_tag not in ("", APP_VERSION):
+    match is_newer_version(latest_tag, APP_VERSION):
         case True:
             QTimer.singleShot(0, main_window, lambda bound_tag=latest_tag: process_notification_display(main_window, "New version available: " + bound_tag, False))
         case False:
@@ -641,23 +894,46 @@ def process_updates_check_async(main_window) -> None:
     return None
 
 
-def validate_singleton_instance(singleton_port: int) -> dict:
-    lock_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
-    lock_name = "\0volt-gui-singleton-" + str(singleton_port)
-    match lock_socket.connect_ex(lock_name) != 0:
+def build_singleton_name() -> str:
+    return SINGLETON_NAME + "-" + str(os.getuid())
+
+
+def is_singleton_listening(singleton_name: str) -> bool:
+    probe_socket = QLocalSocket()
+    probe_socket.setSocketOptions(QLocalSocket.SocketOption.AbstractNamespaceOption)
+    probe_socket.connectToServer(singleton_name)
+    match probe_socket.waitForConnected(SINGLETON_CONNECT_MS):
         case True:
-            lock_socket.close()
-            lock_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
-            lock_socket.bind(lock_name)
-            return {"socket": lock_socket, "running": False}
+            probe_socket.disconnectFromServer()
+            return True
         case False:
-            lock_socket.close()
-            return {"socket": None, "running": True}
+            return False
+
+
+def validate_singleton_instance(singleton_name: str) -> dict:
+    singleton_server = QLocalServer()
+    singleton_server.setSocketOptions(QLocalServer.SocketOption.AbstractNamespaceOption)
+    match singleton_server.listen(singleton_name):
+        case True:
+            return {"server": singleton_server, "running": False}
+        case False:
+            return {"server": None, "running": True}
+
+
+def process_singleton_connection(main_window) -> None:
+    match main_window.singleton_server.nextPendingConnection():
+        case None:
+            return None
+        case connection:
+            connection.disconnectFromServer()
+            connection.deleteLater()
+            process_window_show(main_window)
+            return None
 
 
 def process_signal_handler(main_window, signal_number: int) -> None:
     print("\nReceived signal " + str(signal_number) + ", closing...")
-    process_cleanup(main_window, main_window.singleton_socket)
+    process_cleanup(main_window, main_window.singleton_server)
     QApplication.quit()
     sys.exit(0)
 
@@ -683,9 +959,10 @@ def process_create_tab(stacked_widget, all_widgets: dict, options_widgets: dict,
     return None
 
 
-def create_main_window_widget(singleton_socket):
+def create_main_window_widget(singleton_server):
     window = QMainWindow()
-    window.singleton_socket = singleton_socket
+    window.application = QApplication.instance()
+    window.singleton_server = singleton_server
     window.check_updates = False
     window.start_maximized = False
     window.start_minimized = False
@@ -693,12 +970,22 @@ def create_main_window_widget(singleton_socket):
     window.use_system_tray = False
     window.current_profile = DEFAULT_PROFILE
     window.welcome_window = None
-    window.preview_process = None
-    window.probe_stamp = call_probe_stamp()
+    window.tray_icon = None
+    window.tray_menu = None
+    window.tray_actions = create_tray_actions(window)
+    window.profile_submenu = None
+    window.options_save_timer = None
+    window.initial_setup_complete = False
+    window.preview_process = QProcess(window)
+    window.last_notification = ()
+    window.profile_names = ()
+    window.tray_profiles = ()
+    window.probe_stamp = call_probe_cache_stamp()
+    window.probe_stale = False
     window.setWindowTitle("volt-gui")
+    window.setWindowIcon(build_app_icon())
     window.setMinimumSize(620, 380)
-    window.setAttribute(Qt.WA_DontShowOnScreen, True)
-    process_theme_application(QApplication.instance(), get_persisted_option_resolved("application_theme"))
+    process_theme_application(window.application, get_persisted_option_resolved("application_theme"))
     central_widget = QWidget()
     main_layout = QVBoxLayout(central_widget)
     main_layout.setContentsMargins(8, 8, 8, 8)
@@ -761,20 +1048,12 @@ def create_main_window_widget(singleton_socket):
     process_profile_selector_restore(window)
     window.profile_selector.currentTextChanged.connect(lambda text: process_profile_combo_change(window, text))
     window.preset_selector.currentTextChanged.connect(lambda text: process_preset_combo_change(window, text))
-    for option_key in options_widgets:
-        options_widgets[option_key].currentTextChanged.connect(lambda text, bound_window=window: process_option_change(bound_window))
     process_application_options_load(window)
-    process_dropped_notice(
-        window,
-        process_profile_widget_load(window.all_widgets, window.current_profile))
+    option_change_handler = partial(process_option_text_change, window)
+    for option_widget in options_widgets.values():
+        option_widget.currentTextChanged.connect(option_change_handler)
     process_launch_line_update(window)
-    window.initial_setup_complete = True
-    window.setAttribute(Qt.WA_DontShowOnScreen, False)
-    match QApplication.instance() is None:
-        case False:
-            QApplication.instance().setQuitOnLastWindowClosed(not window.use_system_tray)
-        case True:
-            pass
+    window.application.setQuitOnLastWindowClosed(not window.use_system_tray)
     match window.show_welcome:
         case True:
             QTimer.singleShot(100, lambda: process_welcome_show(window))
@@ -790,11 +1069,17 @@ def create_main_window_widget(singleton_socket):
             QTimer.singleShot(0, lambda: process_window_show(window))
         case True:
             pass
-    window.probe_timer = QTimer(window)
-    window.probe_timer.timeout.connect(lambda: process_probe_poll(window))
-    window.probe_timer.start(PREVIEW_POLL_MS)
-    QTimer.singleShot(PREVIEW_START_MS, lambda: process_preview_start(window))
-    window.closeEvent = lambda close_event: process_window_close(window, singleton_socket, close_event)
+    QTimer.singleShot(0, lambda: process_startup_profile_load(window))
+    window.probe_timer = create_probe_timer(window)
+    window.probe_watcher = create_probe_watcher(window)
+    process_probe_dir_watch_sync(window)
+    process_probe_watch_sync(window, window.probe_stamp)
+    match singleton_server is None:
+        case False:
+            singleton_server.newConnection.connect(lambda: process_singleton_connection(window))
+        case True:
+            pass
+    window.closeEvent = lambda close_event: process_window_close(window, singleton_server, close_event)
     return window
 
 
@@ -805,8 +1090,7 @@ def main() -> None:
             sys.exit(1)
         case False:
             pass
-    singleton_result = validate_singleton_instance(SINGLETON_PORT)
-    match singleton_result["running"]:
+    match is_singleton_listening(build_singleton_name()):
         case True:
             print("volt-gui is already running.")
             sys.exit(0)
@@ -816,9 +1100,16 @@ def main() -> None:
     os.environ.setdefault("QT_LOGGING_RULES", "qt.qpa.theme.gnome=false")
     calculate_initial_scale()
     application = QApplication(sys.argv)
+    singleton_result = validate_singleton_instance(build_singleton_name())
+    match singleton_result["running"]:
+        case True:
+            print("volt-gui is already running.")
+            sys.exit(0)
+        case False:
+            pass
     application.setStyle("Fusion")
     application.setQuitOnLastWindowClosed(False)
-    window = create_main_window_widget(singleton_result["socket"])
+    window = create_main_window_widget(singleton_result["server"])
     process_signal_handlers_setup(window)
     sys.exit(application.exec())
 